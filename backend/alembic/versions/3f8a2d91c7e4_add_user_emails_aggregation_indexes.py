@@ -0,0 +1,29 @@
+"""add_user_emails_aggregation_indexes
+
+Revision ID: 3f8a2d91c7e4
+Revises: c016ed5f698d
+Create Date: 2026-10-14 09:12:41.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8a2d91c7e4'
+down_revision: Union[str, None] = 'c016ed5f698d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite indexes used by the per-user response rate aggregations."""
+    op.create_index('ix_user_emails_user_id_company_name', 'user_emails', ['user_id', 'company_name'])
+    op.create_index('ix_user_emails_user_id_received_at', 'user_emails', ['user_id', 'received_at'])
+
+
+def downgrade() -> None:
+    """Remove the per-user aggregation indexes from user_emails table."""
+    op.drop_index('ix_user_emails_user_id_received_at', table_name='user_emails')
+    op.drop_index('ix_user_emails_user_id_company_name', table_name='user_emails')
@@ -0,0 +1,53 @@
+"""add_status_normalized_column
+
+Revision ID: 8d41e6b0a9f2
+Revises: 3f8a2d91c7e4
+Create Date: 2026-10-14 11:03:17.204915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41e6b0a9f2'
+down_revision: Union[str, None] = '3f8a2d91c7e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _normalize_application_status(application_status):
+    # Frozen copy of db.user_emails.normalize_application_status at this revision.
+    # Done in Python rather than SQL trim() so backfilled rows match newly written ones
+    # (str.strip() also removes tabs and newlines).
+    return (application_status or "").strip().lower()
+
+
+def upgrade() -> None:
+    """Add status_normalized column to user_emails table and backfill normalized values."""
+    op.add_column('user_emails', sa.Column('status_normalized', sa.String(), nullable=False, server_default=''))
+    op.create_index('ix_user_emails_status_normalized', 'user_emails', ['status_normalized'])
+
+    connection = op.get_bind()
+    statuses = connection.execute(
+        sa.text("SELECT DISTINCT application_status FROM user_emails")
+    ).scalars().all()
+    for application_status in statuses:
+        connection.execute(
+            sa.text(
+                "UPDATE user_emails SET status_normalized = :status_normalized "
+                "WHERE application_status = :application_status"
+            ),
+            {
+                "status_normalized": _normalize_application_status(application_status),
+                "application_status": application_status,
+            },
+        )
+
+
+def downgrade() -> None:
+    """Remove status_normalized column from user_emails table."""
+    op.drop_index('ix_user_emails_status_normalized', table_name='user_emails')
+    op.drop_column('user_emails', 'status_normalized')
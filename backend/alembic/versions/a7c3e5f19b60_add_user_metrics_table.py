@@ -0,0 +1,35 @@
+"""add_user_metrics_table
+
+Revision ID: a7c3e5f19b60
+Revises: 8d41e6b0a9f2
+Create Date: 2026-10-14 14:27:52.861370
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e5f19b60'
+down_revision: Union[str, None] = '8d41e6b0a9f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create user_metrics table; rows are built on the next email write or metrics read."""
+    op.create_table(
+        'user_metrics',
+        sa.Column('user_id', sa.String(), sa.ForeignKey('users.user_id'), primary_key=True),
+        sa.Column('total_applications', sa.Integer(), nullable=False),
+        sa.Column('response_rate', sa.Float(), nullable=False),
+        sa.Column('job_title_response_rates', sa.JSON(), nullable=False),
+        sa.Column('updated', sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Drop user_metrics table."""
+    op.drop_table('user_metrics')
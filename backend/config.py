@@ -29,6 +29,7 @@ class Settings(BaseSettings):
         "postgresql://postgres:postgres@db:5432/jobseeker_analytics"
     )
     BATCH_SIZE: int = 10000
+    RATE_LIMIT_STORAGE_URI: str = "memory://"  # e.g. redis://redis:6379/1 to share limits across workers
 
     @field_validator("GOOGLE_SCOPES", mode="before")
     @classmethod
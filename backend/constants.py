@@ -21,6 +21,29 @@ GENERIC_ATS_DOMAINS = [
     "otta.com",
 ]
 
+# One bit per application status label (see the prompt in utils/llm_utils.py), keyed by
+# the normalized status, so all statuses seen for an application fold into a single int
+APPLICATION_STATUS_BITS = {
+    "application confirmation": 1 << 0,
+    "rejection": 1 << 1,
+    "availability request": 1 << 2,
+    "information request": 1 << 3,
+    "assessment sent": 1 << 4,
+    "interview invitation": 1 << 5,
+    "referral - action required": 1 << 6,
+    "did not apply - inbound request": 1 << 7,
+    "action required from company": 1 << 8,
+    "hiring freeze notification": 1 << 9,
+    "withdrew application": 1 << 10,
+    "offer made": 1 << 11,
+    "false positive": 1 << 12,
+}
+OTHER_STATUS_BIT = 1 << 13  # any status outside the labels above
+# An application only counts as responded to if it has a status beyond these
+NO_RESPONSE_STATUS_MASK = (
+    APPLICATION_STATUS_BITS["application confirmation"] | APPLICATION_STATUS_BITS["rejection"]
+)
+
 DEFAULT_DAYS_AGO = 30
 # Get the current date
 current_date = datetime.now()
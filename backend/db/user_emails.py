@@ -1,14 +1,36 @@
 from sqlmodel import SQLModel, Field
 from datetime import datetime
+import sqlalchemy as sa
+
+
+def normalize_application_status(application_status: str) -> str:
+    """
+    Normalizes an application status for grouping, e.g. " Rejection " -> "rejection".
+    """
+    return (application_status or "").strip().lower()
+
 
 class UserEmails(SQLModel, table=True):
     __tablename__ = "user_emails"  
+    __table_args__ = (
+        # Back the per-user aggregations (group by company, order/filter by date)
+        sa.Index("ix_user_emails_user_id_company_name", "user_id", "company_name"),
+        sa.Index("ix_user_emails_user_id_received_at", "user_id", "received_at"),
+    )
     id: str = Field(primary_key=True)  # Gmail email ID (not unique globally)
     user_id: str = Field(primary_key=True)  # Unique per user (composite key)
     company_name: str
     application_status: str
+    status_normalized: str = Field(default="", index=True)  # Derived from application_status on every flush, see below
     received_at: datetime
     subject: str
     job_title: str
     normalized_job_title: str = Field(default="")  # New field for normalized job titles
-    email_from: str  # to avoid 'from' being a reserved key word
\ No newline at end of file
+    email_from: str  # to avoid 'from' being a reserved key word
+
+
+@sa.event.listens_for(UserEmails, "before_insert")
+@sa.event.listens_for(UserEmails, "before_update")
+def _set_status_normalized(mapper, connection, target: UserEmails) -> None:
+    # Single place that keeps status_normalized in sync, so writers never have to set it
+    target.status_normalized = normalize_application_status(target.application_status)
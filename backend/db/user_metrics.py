@@ -0,0 +1,15 @@
+from sqlmodel import SQLModel, Field
+from datetime import datetime
+from typing import List
+import sqlalchemy as sa
+
+class UserMetrics(SQLModel, table=True):
+    """Per-user response rate aggregates, recomputed whenever the user's emails change."""
+    __tablename__ = "user_metrics"
+    user_id: str = Field(foreign_key="users.user_id", primary_key=True)
+    total_applications: int = 0
+    response_rate: float = 0.0  # percentage of applications that got a response
+    job_title_response_rates: List[dict] = Field(
+        default_factory=list, sa_column=sa.Column(sa.JSON, nullable=False)
+    )  # [{"title": ..., "rate": ...}]
+    updated: datetime = Field(default_factory=datetime.utcnow, nullable=False)
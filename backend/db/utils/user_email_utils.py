@@ -2,7 +2,8 @@ from db.user_emails import UserEmails
 from datetime import datetime, timezone
 import email.utils
 import logging
-from sqlmodel import select
+from typing import List, Tuple
+from sqlmodel import select, func, desc
 from utils.job_utils import normalize_job_title
 
 logger = logging.getLogger(__name__)
@@ -23,13 +24,38 @@ def check_email_exists(user_id: str, email_id: str, db_session) -> bool:
     Checks if an email with the given emailId and userId exists in the database.
     """
     db_session.commit()  # Commit pending changes to ensure the database is in latest state
-    statement = select(UserEmails).where(
+    # Only the key is needed to answer existence, so skip hydrating a full UserEmails object
+    statement = select(UserEmails.id).where(
         (UserEmails.user_id == user_id) & (UserEmails.id == email_id)
     )
     result = db_session.exec(statement).first()
     return result is not None
 
 
+def get_normalized_job_title(job_title: str) -> str:
+    """
+    Returns the normalized job title to store alongside the raw job title.
+    Falls back to the capitalized original if normalization fails, and keeps
+    "unknown" or empty titles as-is.
+    """
+    logger.debug(f"Processing job title normalization: '{job_title}'")
+
+    if not job_title or job_title.lower() == "unknown":
+        logger.debug(f"Job title is unknown or empty, keeping as-is: '{job_title}'")
+        return job_title
+
+    try:
+        logger.debug(f"Attempting to normalize job title: '{job_title}'")
+        normalized_result = normalize_job_title(job_title)
+        if normalized_result and normalized_result.strip():
+            logger.debug(f"Job title normalized successfully: '{job_title}' -> '{normalized_result}'")
+            return normalized_result  # Already capitalized by normalize_job_title
+        logger.debug(f"Normalization returned empty, using capitalized original: '{job_title}' -> '{job_title.title()}'")
+    except Exception as e:
+        logger.warning(f"Failed to normalize job title '{job_title}': {e}")
+    return job_title.title()  # Fall back to capitalized original
+
+
 def create_user_email(user, message_data: dict, db_session) -> UserEmails:
     """
     Creates a UserEmail record instance from the provided data.
@@ -45,28 +71,9 @@ def create_user_email(user, message_data: dict, db_session) -> UserEmails:
             logger.info(f"Email with ID {message_data['id']} already exists in the database.")
             return None
         
-        # Normalize the job title
+        # Normalize the job title once at write time so read paths can use them directly
         job_title = message_data["job_title"]
-        normalized_job_title = ""
-        
-        logger.debug(f"Processing job title normalization: '{job_title}'")
-        
-        if job_title and job_title.lower() != "unknown":
-            try:
-                logger.debug(f"Attempting to normalize job title: '{job_title}'")
-                normalized_result = normalize_job_title(job_title)
-                if normalized_result and normalized_result.strip():
-                    normalized_job_title = normalized_result  # Already capitalized by normalize_job_title
-                    logger.debug(f"Job title normalized successfully: '{job_title}' -> '{normalized_job_title}'")
-                else:
-                    normalized_job_title = job_title.title()  # Fall back to capitalized original
-                    logger.debug(f"Normalization returned empty, using capitalized original: '{job_title}' -> '{normalized_job_title}'")
-            except Exception as e:
-                logger.warning(f"Failed to normalize job title '{job_title}': {e}")
-                normalized_job_title = job_title.title()  # Fall back to capitalized original
-        else:
-            normalized_job_title = job_title  # Keep "unknown" or empty titles as-is
-            logger.debug(f"Job title is unknown or empty, keeping as-is: '{normalized_job_title}'")
+        normalized_job_title = get_normalized_job_title(job_title)
         
         logger.debug(f"Creating UserEmails record with normalized_job_title: '{normalized_job_title}'")
                 
@@ -88,3 +95,59 @@ def create_user_email(user, message_data: dict, db_session) -> UserEmails:
     except Exception as e:
         logger.error(f"Error creating UserEmail record for user_id: {user.user_id}, email_id: {message_data.get('id', 'unknown')}: {e}")
         return None
+
+
+def get_company_statuses(user_id: str, db_session) -> List[Tuple[str, str]]:
+    """
+    Returns the distinct (company_name, status) pairs for a user's emails.
+    Grouping happens in SQL so a company with many emails comes back as one row
+    per status instead of one row per email. Empty and "unknown" statuses are skipped.
+    """
+    statement = (
+        select(UserEmails.company_name, UserEmails.status_normalized)
+        .where(UserEmails.user_id == user_id)
+        .where(UserEmails.company_name != "")
+        .where(UserEmails.status_normalized.notin_(["", "unknown"]))
+        .group_by(UserEmails.company_name, UserEmails.status_normalized)
+    )
+    return db_session.exec(statement).all()
+
+
+def get_company_job_title_statuses(user_id: str, db_session) -> List[Tuple[str, str, str, str]]:
+    """
+    Returns the distinct (company_name, status, job_title, normalized_job_title) groups
+    for a user's emails, ordered by the most recently received email in each group.
+    The first row seen for a company therefore carries the job title of its latest email.
+    """
+    statement = (
+        select(
+            UserEmails.company_name,
+            UserEmails.status_normalized,
+            UserEmails.job_title,
+            UserEmails.normalized_job_title,
+        )
+        .where(UserEmails.user_id == user_id)
+        .where(UserEmails.company_name != "")
+        .where(UserEmails.status_normalized.notin_(["", "unknown"]))
+        .group_by(
+            UserEmails.company_name,
+            UserEmails.status_normalized,
+            UserEmails.job_title,
+            UserEmails.normalized_job_title,
+        )
+        .order_by(desc(func.max(UserEmails.received_at)))
+    )
+    return db_session.exec(statement).all()
+
+
+def get_application_statuses(user_id: str, db_session) -> List[Tuple[str, str]]:
+    """
+    Returns the (id, status_normalized) of each of the user's emails, skipping empty
+    and "unknown" statuses. Rows keep the column names, so `row.status_normalized` works.
+    """
+    statement = (
+        select(UserEmails.id, UserEmails.status_normalized)
+        .where(UserEmails.user_id == user_id)
+        .where(UserEmails.status_normalized.notin_(["", "unknown"]))
+    )
+    return db_session.exec(statement).all()
@@ -0,0 +1,156 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Tuple
+from sqlalchemy.exc import IntegrityError
+from constants import APPLICATION_STATUS_BITS, OTHER_STATUS_BIT, NO_RESPONSE_STATUS_MASK
+from db.user_metrics import UserMetrics
+from db.utils.user_email_utils import get_company_statuses, get_company_job_title_statuses
+
+logger = logging.getLogger(__name__)
+
+# Metrics are refreshed on every write to user_emails; this only catches rows changed outside the app
+USER_METRICS_MAX_AGE = timedelta(hours=1)
+
+
+def _aggregate_by_company(company_statuses) -> dict:
+    """
+    Folds rows starting with (company_name, status) into company -> bitmask of the
+    statuses seen for that company. Unknown statuses are already excluded in SQL.
+    """
+    applications = {}
+    for row in company_statuses:
+        company_name = row[0]
+        applications[company_name] = applications.get(company_name, 0) | APPLICATION_STATUS_BITS.get(row[1], OTHER_STATUS_BIT)
+    return applications
+
+
+def calculate_job_title_response_rates(user_id: str, db_session) -> list:
+    """
+    Calculates the response rate of each normalized job title the user applied for.
+    """
+    # Get distinct company/status/job title groups from DB, most recent first
+    company_statuses = get_company_job_title_statuses(user_id, db_session)
+    logger.info(f"Retrieved {len(company_statuses)} company status groups for user_id: {user_id}")
+
+    # Create unique application IDs based on company_name only (ignore job_title for now)
+    status_masks = _aggregate_by_company(company_statuses)
+    logger.info(f"Created {len(status_masks)} unique applications for user_id: {user_id}")
+
+    # The first group seen for a company belongs to its most recent email
+    latest_job_titles = {}
+    for company_name, _, job_title, normalized_job_title in company_statuses:
+        if company_name not in latest_job_titles:
+            latest_job_titles[company_name] = (job_title, normalized_job_title)
+
+    # Group applications by normalized job title: total applications and responses per title
+    title_totals = {}
+    title_responses = {}
+
+    for company_name, (job_title, normalized_job_title) in latest_job_titles.items():
+        # Skip applications with "unknown" job titles
+        if job_title and job_title.lower() != "unknown":
+            # normalized_job_title is populated at write time (and backfilled by migration)
+            if normalized_job_title and normalized_job_title.strip():
+                display_title = normalized_job_title.title()  # Ensure capitalization
+            else:
+                logger.warning(f"Missing normalized job title for '{job_title}', using capitalized original")
+                display_title = job_title.title()
+
+            title_totals[display_title] = title_totals.get(display_title, 0) + 1
+
+            # Check if this application received any response beyond initial confirmation/rejection
+            if status_masks[company_name] & ~NO_RESPONSE_STATUS_MASK:
+                title_responses[display_title] = title_responses.get(display_title, 0) + 1
+
+    logger.info(f"Grouped into {len(title_totals)} job title categories for user_id: {user_id}")
+
+    # Calculate response rates for each job title
+    response_rate = []
+    for job_title, total in title_totals.items():
+        responses = title_responses.get(job_title, 0)
+        rate = round((responses / total) * 100, 2)
+        response_rate.append({
+            "title": job_title,
+            "rate": rate
+        })
+        logger.debug(f"Job title '{job_title}': {responses}/{total} = {rate}% response rate")
+
+    logger.info(f"Calculated response rates for {len(response_rate)} job titles for user_id: {user_id}")
+    return response_rate
+
+
+def calculate_response_rate(user_id: str, db_session) -> Tuple[int, float]:
+    """
+    Returns the user's number of applications and the percentage of them that received a response.
+    """
+    company_statuses = get_company_statuses(user_id, db_session)
+    applications = _aggregate_by_company(company_statuses)
+
+    # Calculate response rate; if user has no valid applications just return 0.0
+    total_applications = len(applications)
+    if total_applications == 0:
+        return 0, 0.0
+
+    # Count applications that received a response (not just application confirmation or rejection)
+    responses_received = sum(1 for status_mask in applications.values() if status_mask & ~NO_RESPONSE_STATUS_MASK)
+    response_rate_percent = (responses_received / total_applications) * 100
+    return total_applications, round(response_rate_percent, 1)
+
+
+def _save_user_metrics(user_id: str, values: dict, db_session) -> UserMetrics:
+    """
+    Inserts or updates the user's metrics row; merge loads any existing row by primary key.
+    """
+    metrics = db_session.merge(UserMetrics(user_id=user_id, updated=datetime.utcnow(), **values))
+    db_session.commit()
+    return metrics
+
+
+def refresh_user_metrics(user_id: str, db_session) -> UserMetrics:
+    """
+    Recomputes the user's metrics row from their emails, raising on failure.
+    Write paths should call try_refresh_user_metrics instead, so a failed refresh
+    doesn't fail a write that is already committed.
+    """
+    total_applications, response_rate = calculate_response_rate(user_id, db_session)
+    job_title_response_rates = calculate_job_title_response_rates(user_id, db_session)
+
+    values = dict(
+        total_applications=total_applications,
+        response_rate=response_rate,
+        job_title_response_rates=job_title_response_rates,
+    )
+    try:
+        metrics = _save_user_metrics(user_id, values, db_session)
+    except IntegrityError:
+        # A concurrent refresh may have inserted the row between our read and our insert;
+        # retrying turns that into an update. Any other violation (e.g. no such user) raises again.
+        db_session.rollback()
+        logger.info("user_id: %s metrics row insert conflicted, retrying as update", user_id)
+        metrics = _save_user_metrics(user_id, values, db_session)
+
+    logger.info("user_id: %s refreshed metrics for %s applications", user_id, total_applications)
+    return metrics
+
+
+def try_refresh_user_metrics(user_id: str, db_session) -> None:
+    """
+    Best-effort refresh_user_metrics for write paths whose own change is already committed.
+    Failures are logged rather than raised; get_user_metrics rebuilds the row once it is stale.
+    """
+    try:
+        refresh_user_metrics(user_id, db_session)
+    except Exception as e:
+        logger.error("user_id: %s failed to refresh metrics: %s", user_id, e)
+        db_session.rollback()
+
+
+def get_user_metrics(user_id: str, db_session) -> UserMetrics:
+    """
+    Returns the user's metrics row, rebuilding it if it is missing or older than USER_METRICS_MAX_AGE.
+    """
+    metrics = db_session.get(UserMetrics, user_id)
+    if metrics is None or datetime.utcnow() - metrics.updated > USER_METRICS_MAX_AGE:
+        logger.info("user_id: %s metrics missing or stale, rebuilding", user_id)
+        metrics = refresh_user_metrics(user_id, db_session)
+    return metrics
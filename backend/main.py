@@ -5,8 +5,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from starlette.middleware.sessions import SessionMiddleware
 from fastapi.middleware.cors import CORSMiddleware
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from utils.rate_limit_utils import limiter
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 from utils.config_utils import get_settings
@@ -51,7 +50,6 @@ app.include_router(users_routes.router)
 app.include_router(start_date_routes.router)
 app.include_router(job_applications_routes.router)
 
-limiter = Limiter(key_func=get_remote_address)
 app.state.limiter = limiter  # Ensure limiter is assigned
 
 # Add SlowAPI middleware for rate limiting
@@ -12,11 +12,9 @@ from utils.config_utils import get_settings
 from utils.cookie_utils import set_conditional_cookie
 from routes.email_routes import fetch_emails_to_db
 import database
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from utils.rate_limit_utils import limiter
 import os
 
-limiter = Limiter(key_func=get_remote_address)
 
 # Logger setup
 logger = logging.getLogger(__name__)
@@ -12,6 +12,7 @@ from utils.email_utils import get_email_ids, get_email, decode_subject_line
 from utils.llm_utils import process_email
 from utils.task_utils import exceeds_rate_limit
 from utils.config_utils import get_settings
+from db.utils.user_metrics_utils import try_refresh_user_metrics
 from session.session_layer import validate_session
 import database
 from google.oauth2.credentials import Credentials
@@ -19,11 +20,8 @@ import json
 from start_date.storage import get_start_date_email_filter
 from constants import QUERY_APPLIED_EMAIL_FILTER
 from datetime import datetime
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from utils.job_utils import normalize_job_title
+from utils.rate_limit_utils import limiter
 
-limiter = Limiter(key_func=get_remote_address)
 
 # Logger setup
 logger = logging.getLogger(__name__)
@@ -92,25 +90,18 @@ def query_emails(request: Request, db_session: database.DBSession, user_id: str
         # Query emails sorted by date (newest first)
         db_session.expire_all()  # Clear any cached data
         db_session.commit()  # Commit pending changes to ensure the database is in latest state
-        statement = select(UserEmails).where(UserEmails.user_id == user_id).order_by(desc(UserEmails.received_at))
+        # Filter out records with "unknown" application status in SQL so they are never loaded
+        statement = (
+            select(UserEmails)
+            .where(UserEmails.user_id == user_id)
+            .where(UserEmails.status_normalized.notin_(["", "unknown"]))
+            .order_by(desc(UserEmails.received_at))
+        )
+        # normalized_job_title and status_normalized are populated at write time
         user_emails = db_session.exec(statement).all()
 
-        for email in user_emails:
-            new_job_title = normalize_job_title(email.job_title)
-            if email.normalized_job_title != new_job_title:
-                email.normalized_job_title = new_job_title
-                db_session.add(email)
-                db_session.commit()
-                logger.info(f"Updated normalized job title for email {email.id} to {new_job_title}")
-
-        # Filter out records with "unknown" application status
-        filtered_emails = [
-            email for email in user_emails 
-            if email.application_status and email.application_status.lower() != "unknown"
-        ]
-
-        logger.info(f"Found {len(user_emails)} total emails, returning {len(filtered_emails)} after filtering out 'unknown' status")
-        return filtered_emails  # Return filtered list
+        logger.info(f"Found {len(user_emails)} emails after filtering out 'unknown' status")
+        return user_emails
 
     except Exception as e:
         logger.error(f"Error fetching emails for user_id {user_id}: {e}")
@@ -139,6 +130,7 @@ async def delete_email(request: Request, db_session: database.DBSession, email_i
         # Delete the email record
         db_session.delete(email_record)
         db_session.commit()
+        try_refresh_user_metrics(user_id, db_session)
 
         logger.info(f"Email with id {email_id} deleted successfully for user_id {user_id}")
         return {"message": "Item deleted successfully"}
@@ -360,6 +352,8 @@ def fetch_emails_to_db(
         logger.info(f"About to add {len(email_records)} email records to database for user {user_id}")
         db_session.add_all(email_records)
         db_session.commit()  # Commit immediately after adding records
+        # Before FINISHED so the dashboard never reads pre-fetch metrics; failures are only logged
+        try_refresh_user_metrics(user_id, db_session)
         logger.info(
             f"Successfully committed {len(email_records)} email records for user {user_id}"
         )
@@ -4,12 +4,12 @@ import logging
 import plotly.graph_objects as go
 from fastapi import APIRouter, HTTPException, Request, Depends
 from fastapi.responses import FileResponse, RedirectResponse
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from utils.rate_limit_utils import limiter
 import database
 from utils.file_utils import get_user_filepath
 from session.session_layer import validate_session
 from routes.email_routes import query_emails
+from db.utils.user_email_utils import get_application_statuses
 from utils.config_utils import get_settings
 
 settings = get_settings()
@@ -19,7 +19,22 @@ logger = logging.getLogger(__name__)
 
 # FastAPI router for file routes
 router = APIRouter()
-limiter = Limiter(key_func=get_remote_address)
+
+# Statuses with their own node in the PNG Sankey diagram; anything else counts as unknown
+SANKEY_STATUSES = frozenset({
+    "offer made",
+    "rejection",
+    "availability request",
+    "interview invitation",
+    "assessment sent",
+    "application confirmation",
+    "information request",
+    "inbound request",
+    "action required",
+    "hiring freeze",
+    "withdrew application",
+    "false positive",
+})
 
 
 @router.get("/download-file")
@@ -117,7 +132,7 @@ def get_sankey_data_dict(emails):
     num_false_positive = 0
 
     for email in emails:
-        status = email.application_status.strip().lower()
+        status = email.status_normalized
         num_applications += 1
         if status == "offer made":
             num_offer_made += 1
@@ -247,7 +262,8 @@ async def get_sankey_data(
 ):
     if not user_id:
         return RedirectResponse("/logout", status_code=303)
-    emails = query_emails(request, db_session=db_session, user_id=user_id)
+    # Only the statuses are needed, so skip the full email query and its formatting
+    emails = get_application_statuses(user_id, db_session)
     if not emails:
         raise HTTPException(status_code=400, detail="No data found to write")
     sankey_data = get_sankey_data_dict(emails)
@@ -291,7 +307,7 @@ async def process_sankey(
 
     # Count each status from the emails
     for email in emails:
-        status = email.application_status.strip().lower()
+        status = email.status_normalized
         node_counts[status] = node_counts.get(status, 0) + 1
 
     # Set individual variables for the PNG generation
@@ -308,23 +324,7 @@ async def process_sankey(
     num_withdrew_application = node_counts.get("withdrew application", 0)
     num_false_positive = node_counts.get("false positive", 0)
     num_unknown_status = sum(
-        1
-        for email in emails
-        if email.application_status.strip().lower()
-        not in [
-            "offer made",
-            "rejection",
-            "availability request",
-            "interview invitation",
-            "assessment sent",
-            "application confirmation",
-            "information request",
-            "inbound request",
-            "action required",
-            "hiring freeze",
-            "withdrew application",
-            "false positive",
-        ]
+        count for status, count in node_counts.items() if status not in SANKEY_STATUSES
     )
 
     # Use the same data structure as the dashboard (filtered, no 0-count nodes)
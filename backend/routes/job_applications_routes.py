@@ -7,12 +7,12 @@ from datetime import datetime
 import uuid
 
 from db.user_emails import UserEmails
+from db.utils.user_email_utils import get_normalized_job_title
 from session.session_layer import validate_session
 import database
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from db.utils.user_metrics_utils import try_refresh_user_metrics
+from utils.rate_limit_utils import limiter
 
-limiter = Limiter(key_func=get_remote_address)
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -69,12 +69,14 @@ async def create_job_application(
             received_at=application.received_at,
             subject=application.subject,
             job_title=application.job_title,
+            normalized_job_title=get_normalized_job_title(application.job_title),
             email_from=application.email_from or "Manually Added"
         )
         
         db_session.add(new_application)
         db_session.commit()
         db_session.refresh(new_application)
+        try_refresh_user_metrics(user_id, db_session)
         
         logger.info(f"Successfully created job application with id: {manual_app_id}")
         
@@ -124,10 +126,14 @@ async def update_job_application(
         update_data = application_update.dict(exclude_unset=True)
         for field, value in update_data.items():
             setattr(existing_application, field, value)
+        # Keep the derived title in sync (status_normalized is set by the model listener)
+        if "job_title" in update_data:
+            existing_application.normalized_job_title = get_normalized_job_title(existing_application.job_title)
         
         db_session.add(existing_application)
         db_session.commit()
         db_session.refresh(existing_application)
+        try_refresh_user_metrics(user_id, db_session)
         
         logger.info(f"Successfully updated job application with id: {application_id}")
         
@@ -6,11 +6,9 @@ import json
 from utils.auth_utils import AuthenticatedUser
 from google.oauth2.credentials import Credentials
 from session.session_layer import validate_session
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from utils.rate_limit_utils import limiter
 import database
 
-limiter = Limiter(key_func=get_remote_address)
 
 # Logger setup
 logger = logging.getLogger(__name__)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+One-off backfill of user_emails.normalized_job_title for rows written before
+the column was populated at ingest.
+
+Run from the backend directory: python scripts/backfill_normalized_job_titles.py
+"""
+
+import os
+import sys
+
+# Add the backend directory to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sqlalchemy as sa  # noqa: E402
+from database import engine  # noqa: E402
+from db.utils.user_email_utils import get_normalized_job_title  # noqa: E402
+
+
+def backfill_normalized_job_titles() -> int:
+    """Fills in missing normalized job titles, one UPDATE per distinct raw title."""
+    updated = 0
+    with engine.begin() as connection:
+        missing_titles = connection.execute(
+            sa.text(
+                "SELECT DISTINCT job_title FROM user_emails "
+                "WHERE normalized_job_title IS NULL OR normalized_job_title = ''"
+            )
+        ).scalars().all()
+        for job_title in missing_titles:
+            result = connection.execute(
+                sa.text(
+                    "UPDATE user_emails SET normalized_job_title = :normalized_job_title "
+                    "WHERE job_title = :job_title AND (normalized_job_title IS NULL OR normalized_job_title = '')"
+                ),
+                {"normalized_job_title": get_normalized_job_title(job_title) or "", "job_title": job_title},
+            )
+            updated += result.rowcount
+    return updated
+
+
+if __name__ == "__main__":
+    print(f"Backfilled normalized_job_title on {backfill_normalized_job_titles()} rows")
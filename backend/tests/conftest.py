@@ -19,6 +19,7 @@ import main  # noqa: E402
 from session.session_layer import validate_session  # noqa: E402
 from db.processing_tasks import STARTED, FINISHED, TaskRuns  # noqa: E402
 from db.users import Users  # noqa: E402
+from db.user_emails import UserEmails  # noqa: E402
 
 # Use SQLite for GitHub CI pipeline and Docker environments
 os.environ["DATABASE_URL"] = "sqlite:///:memory:"
@@ -120,6 +121,31 @@ def task_factory(db_session, logged_in_user):
     return _create_task
 
 
+@pytest.fixture
+def email_factory(db_session, logged_in_user):
+    def _create_email(
+        email_id, company_name="Acme", application_status="Application confirmation",
+        job_title="Software Engineer", normalized_job_title="Software Engineer",
+        received_at=datetime(2025, 1, 1)
+    ):
+        email = UserEmails(
+            id=email_id,
+            user_id=logged_in_user.user_id,
+            company_name=company_name,
+            application_status=application_status,
+            received_at=received_at,
+            subject="subject",
+            job_title=job_title,
+            normalized_job_title=normalized_job_title,
+            email_from="jobs@example.com",
+        )
+        db_session.add(email)
+        db_session.commit()
+        return email
+
+    return _create_email
+
+
 @pytest.fixture
 def user_factory(db_session):
     def _create_user(
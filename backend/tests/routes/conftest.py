@@ -0,0 +1,11 @@
+import pytest
+
+from utils.rate_limit_utils import limiter
+
+
+@pytest.fixture(autouse=True)
+def disable_rate_limit():
+    # Every router shares this limiter, so one switch covers all route tests
+    limiter.enabled = False
+    yield
+    limiter.enabled = True
@@ -2,6 +2,7 @@ from unittest import mock
 from fastapi import Request
 
 from db.processing_tasks import TaskRuns, FINISHED, STARTED
+from db.user_emails import UserEmails
 from routes.email_routes import fetch_emails_to_db
 
 
@@ -53,3 +54,26 @@ def test_fetch_emails_to_db_in_progress_rate_limited_no_processing(
         # Re-fetch the task from the db to ensure we have the latest state
         task_run = db_session.get(TaskRuns, logged_in_user.user_id)
         assert task_run.status == STARTED
+
+
+def test_delete_email_succeeds_when_metrics_refresh_fails(logged_in_client, logged_in_user, db_session, email_factory):
+    email_factory("1", application_status="Rejection")
+
+    with mock.patch(
+        "db.utils.user_metrics_utils.refresh_user_metrics", side_effect=RuntimeError("boom")
+    ):
+        resp = logged_in_client.delete("/delete-email/1")
+
+    assert resp.status_code == 200
+    assert db_session.get(UserEmails, ("1", logged_in_user.user_id)) is None
+
+
+def test_query_emails_returns_stored_normalized_job_title(logged_in_client, logged_in_user, db_session, email_factory):
+    email_factory("1", application_status="Rejection", job_title="unknown", normalized_job_title="unknown")
+
+    resp = logged_in_client.get("/get-emails")
+
+    assert resp.status_code == 200
+    # the read path serves the write-time value instead of re-normalizing it
+    assert [email["normalized_job_title"] for email in resp.json()] == ["unknown"]
+    assert db_session.get(UserEmails, ("1", logged_in_user.user_id)).normalized_job_title == "unknown"
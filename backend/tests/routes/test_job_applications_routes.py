@@ -0,0 +1,12 @@
+def test_update_job_application_recomputes_derived_columns(logged_in_client, db_session, email_factory):
+    application = email_factory("manual_1", job_title="Unknown", normalized_job_title="Unknown")
+
+    resp = logged_in_client.put(
+        "/job-applications/manual_1",
+        json={"application_status": " Interview Invitation ", "job_title": "sr. software engineer"},
+    )
+    assert resp.status_code == 200
+
+    db_session.refresh(application)
+    assert application.status_normalized == "interview invitation"
+    assert application.normalized_job_title == "Software Engineer"
@@ -0,0 +1,70 @@
+from datetime import datetime
+
+
+def test_user_response_rate_no_emails(logged_in_client):
+    resp = logged_in_client.get("/user-response-rate")
+    assert resp.status_code == 200
+    assert resp.json() == {"value": 0.0}
+
+
+def test_user_response_rate_groups_by_company(logged_in_client, email_factory):
+    email_factory("1", "Acme", "Application confirmation")
+    email_factory("2", "Acme", " Interview Invitation ")
+    email_factory("3", "Globex", "application confirmation")
+    email_factory("4", "Globex", "rejection")
+    # companies with only unknown statuses are not counted as applications
+    email_factory("5", "Initech", "unknown")
+
+    resp = logged_in_client.get("/user-response-rate")
+    assert resp.status_code == 200
+    assert resp.json() == {"value": 50.0}
+
+
+def test_user_response_rate_counts_unrecognized_status_as_response(logged_in_client, email_factory):
+    email_factory("1", "Acme", "application confirmation")
+    email_factory("2", "Acme", "Recruiter follow-up")
+
+    resp = logged_in_client.get("/user-response-rate")
+    assert resp.status_code == 200
+    assert resp.json() == {"value": 100.0}
+
+
+def test_response_rate_by_job_title(logged_in_client, email_factory):
+    email_factory("1", "Acme", "application confirmation", received_at=datetime(2025, 1, 1))
+    email_factory(
+        "2", "Acme", "interview invitation", job_title="Data Scientist",
+        normalized_job_title="Data Scientist", received_at=datetime(2025, 2, 1)
+    )
+    email_factory("3", "Globex", "application confirmation")
+    email_factory("4", "Initech", "assessment sent")
+    email_factory("5", "Hooli", "rejection", job_title="unknown", normalized_job_title="unknown")
+
+    resp = logged_in_client.get("/get-response-rate")
+    assert resp.status_code == 200
+    # Acme is grouped under the job title of its most recent email
+    assert sorted(resp.json(), key=lambda item: item["title"]) == [
+        {"title": "Data Scientist", "rate": 100.0},
+        {"title": "Software Engineer", "rate": 50.0},
+    ]
+
+
+def test_user_response_rate_refreshed_on_new_application(logged_in_client, email_factory):
+    email_factory("1", "Acme", "application confirmation")
+    assert logged_in_client.get("/user-response-rate").json() == {"value": 0.0}
+
+    # rows written outside the app are not seen until the metrics row is refreshed
+    email_factory("2", "Acme", "interview invitation")
+    assert logged_in_client.get("/user-response-rate").json() == {"value": 0.0}
+
+    resp = logged_in_client.post(
+        "/job-applications",
+        json={
+            "company_name": "Globex",
+            "application_status": "application confirmation",
+            "received_at": "2025-01-02T00:00:00",
+            "subject": "Thanks for applying",
+            "job_title": "Software Engineer",
+        },
+    )
+    assert resp.status_code == 200
+    assert logged_in_client.get("/user-response-rate").json() == {"value": 50.0}
@@ -44,3 +44,11 @@ def test_get_side_with_job_role():
     assert get_side_with_job_role("Engineer-Manager") == "Engineer-Manager"
     assert get_side_with_job_role("AI/ML Engineer", "slash") == "AI/ML Engineer"
     assert get_side_with_job_role("AI/ ML Engineer", "slash") == "ML Engineer"
+
+
+def test_normalize_job_title_is_memoized():
+    normalize_job_title.cache_clear()
+    first = normalize_job_title("Senior Software Engineer - Remote")
+    second = normalize_job_title("Senior Software Engineer - Remote")
+    assert first == second
+    assert normalize_job_title.cache_info().hits == 1
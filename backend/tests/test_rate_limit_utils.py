@@ -0,0 +1,19 @@
+from fastapi import Request
+
+from utils.rate_limit_utils import get_rate_limit_key
+
+
+def make_request(session=None):
+    scope = {"type": "http", "client": ("203.0.113.7", 1234), "headers": []}
+    if session is not None:
+        scope["session"] = session
+    return Request(scope)
+
+
+def test_get_rate_limit_key_uses_user_id_when_logged_in():
+    assert get_rate_limit_key(make_request({"user_id": "123"})) == "user:123"
+
+
+def test_get_rate_limit_key_falls_back_to_ip():
+    assert get_rate_limit_key(make_request({})) == "203.0.113.7"
+    assert get_rate_limit_key(make_request()) == "203.0.113.7"
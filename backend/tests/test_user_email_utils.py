@@ -0,0 +1,20 @@
+from db.utils.user_email_utils import get_application_statuses, get_company_statuses
+from tests.db_test_utils import create_sankey_test_emails
+
+
+def test_seeded_emails_are_visible_to_status_queries(db_session, logged_in_user):
+    # The seeding helper never sets status_normalized; the model listener must derive it
+    emails = create_sankey_test_emails(db_session, logged_in_user.user_id)
+
+    assert len(get_application_statuses(logged_in_user.user_id, db_session)) == len(emails)
+    assert get_company_statuses(logged_in_user.user_id, db_session)
+
+
+def test_status_normalized_follows_application_status_on_update(db_session, email_factory):
+    email = email_factory("1", application_status=" Application confirmation ")
+    assert email.status_normalized == "application confirmation"
+
+    email.application_status = "Rejection"
+    db_session.commit()
+    db_session.refresh(email)
+    assert email.status_normalized == "rejection"
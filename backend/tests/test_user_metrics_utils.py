@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+from unittest import mock
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from db.user_metrics import UserMetrics
+from db.utils import user_metrics_utils
+from db.utils.user_metrics_utils import get_user_metrics, refresh_user_metrics, USER_METRICS_MAX_AGE
+
+
+def test_refresh_user_metrics_writes_row(db_session, logged_in_user, email_factory):
+    email_factory("1", "Acme", "Application confirmation")
+    email_factory("2", "Acme", "Interview invitation")
+    email_factory("3", "Globex", "Rejection")
+
+    refresh_user_metrics(logged_in_user.user_id, db_session)
+
+    metrics = db_session.get(UserMetrics, logged_in_user.user_id)
+    assert metrics.total_applications == 2
+    assert metrics.response_rate == 50.0
+    assert metrics.job_title_response_rates == [{"title": "Software Engineer", "rate": 50.0}]
+
+
+def test_get_user_metrics_reads_fresh_row_without_recomputing(db_session, logged_in_user, email_factory):
+    refresh_user_metrics(logged_in_user.user_id, db_session)
+    email_factory("1", "Acme", "Interview invitation")
+
+    assert get_user_metrics(logged_in_user.user_id, db_session).total_applications == 0
+
+
+def test_get_user_metrics_rebuilds_stale_row(db_session, logged_in_user, email_factory):
+    metrics = refresh_user_metrics(logged_in_user.user_id, db_session)
+    metrics.updated = datetime.utcnow() - USER_METRICS_MAX_AGE - timedelta(minutes=1)
+    db_session.add(metrics)
+    db_session.commit()
+    email_factory("1", "Acme", "Interview invitation")
+
+    metrics = get_user_metrics(logged_in_user.user_id, db_session)
+    assert metrics.total_applications == 1
+    assert metrics.response_rate == 100.0
+
+
+def test_refresh_user_metrics_updates_row_inserted_concurrently(db_session, logged_in_user, email_factory):
+    email_factory("1", "Acme", "Interview invitation")
+    save = user_metrics_utils._save_user_metrics
+
+    def concurrent_insert_then_conflict(user_id, values, session):
+        # Another refresh commits the row first, so our insert hits a duplicate key
+        session.add(UserMetrics(user_id=user_id))
+        session.commit()
+        raise IntegrityError("INSERT INTO user_metrics", {}, Exception("duplicate key"))
+
+    calls = iter([concurrent_insert_then_conflict, save])
+    with mock.patch.object(user_metrics_utils, "_save_user_metrics", side_effect=lambda *args: next(calls)(*args)):
+        metrics = refresh_user_metrics(logged_in_user.user_id, db_session)
+
+    assert metrics is not None
+    assert metrics.total_applications == 1
+    assert db_session.get(UserMetrics, logged_in_user.user_id).response_rate == 100.0
+
+
+def test_refresh_user_metrics_raises_on_persistent_integrity_error(db_session, logged_in_user):
+    error = IntegrityError("INSERT INTO user_metrics", {}, Exception("foreign key violation"))
+    with mock.patch.object(user_metrics_utils, "_save_user_metrics", side_effect=error):
+        with pytest.raises(IntegrityError):
+            refresh_user_metrics(logged_in_user.user_id, db_session)
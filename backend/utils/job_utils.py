@@ -1,5 +1,6 @@
 import re
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -222,10 +223,12 @@ def preprocess_title(title):
     
     return title
 
+@lru_cache(maxsize=8192)
 def normalize_job_title(title):
     """
     Normalizes a raw job title into a standardized format.
     Returns a normalized string or None if the title is invalid.
+    Results are memoized since the same raw titles recur across many emails.
     """
     if not isinstance(title, str):
         return None
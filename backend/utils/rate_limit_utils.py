@@ -0,0 +1,30 @@
+import logging
+from fastapi import Request
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+from utils.config_utils import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def get_rate_limit_key(request: Request) -> str:
+    """
+    Rate limits logged in users by user_id so one user cannot get around a limit by
+    switching networks; falls back to the client IP for anonymous requests.
+    The session cookie is signed by SessionMiddleware, so the user_id cannot be forged.
+    """
+    user_id = request.session.get("user_id") if "session" in request.scope else None
+    if user_id:
+        return f"user:{user_id}"
+    return get_remote_address(request)
+
+
+# Single limiter shared by every router and the app. With the default memory:// storage
+# each worker process keeps its own counters; point RATE_LIMIT_STORAGE_URI at Redis
+# (e.g. redis://redis:6379/1) so the limits hold across workers.
+limiter = Limiter(
+    key_func=get_rate_limit_key,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    in_memory_fallback_enabled=True,  # keep limiting per worker if Redis is unreachable
+)